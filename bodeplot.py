@@ -4,74 +4,158 @@ import matplotlib.pyplot as plt
 import numpy as np
 from scipy import signal
 
-from pade import pade
+if __package__:
+    from .pade import pade
+else:
+    # running from the source directory rather than as a package
+    from pade import pade
+
+
+def _add_timedelay(num, den, td, n):
+    """ Multiply a transfer function by the order n Padé approximation of exp(-td*s)"""
+
+    pade_num, pade_den = pade(td, n)
+    num = np.convolve(np.asarray(num, dtype=np.float64), pade_num)
+    den = np.convolve(np.asarray(den, dtype=np.float64), pade_den)
+    # drop leading zeros as poly1d.c used to; a no-op for nonzero-leading input
+    return (np.trim_zeros(num, 'f'), np.trim_zeros(den, 'f'))
+
+
+@lru_cache(maxsize=8)
+def _freq_grid(lo, hi, n, log):
+    """ Shared, read-only frequency grid from lo to hi with n samples"""
+
+    if log:
+        grid = np.logspace(np.log10(lo), np.log10(hi), n)
+    else:
+        grid = np.linspace(lo, hi, n)
+    grid.flags.writeable = False
+    return grid
+
+
+# (lo, hi, n, log) -> widest Vandermonde matrix of 1j*grid built so far,
+# capped like _freq_grid and evicting the least recently used grid
+_VANDER_CACHE_SIZE = 8
+_vander_cache = {}
+
+
+def _get_vander(lo, hi, n, log, deg):
+    """ Columns (jw)**0 ... (jw)**deg over the shared frequency grid"""
+
+    key = (lo, hi, n, log)
+    V = _vander_cache.pop(key, None)
+    if V is None or V.shape[1] <= deg:
+        s = 1j * _freq_grid(lo, hi, n, log)
+        V = np.vander(s, deg + 1, increasing=True)
+        V.flags.writeable = False
+    _vander_cache[key] = V
+    while len(_vander_cache) > _VANDER_CACHE_SIZE:
+        del _vander_cache[next(iter(_vander_cache))]
+    return V[:, :deg + 1]
+
+
+@lru_cache(maxsize=32)
+def _bodefy(num, den, td, n, n_points):
+    """ Cached Bode computation keyed on the transfer function parameters
+
+    return: (num, den, w, mag, phase), all marked read-only as they are shared
+            between callers
+    """
+
+    freq_range = _freq_grid(0.01, 100, n_points, True)
+    if td:
+        num, den = _add_timedelay(num, den, td, n)
+    else:
+        num = np.trim_zeros(np.asarray(num, dtype=np.float64), 'f')
+        den = np.trim_zeros(np.asarray(den, dtype=np.float64), 'f')
+
+    # evaluate H(jw) as V @ coeffs against a Vandermonde matrix shared by
+    # every transfer function on the same grid, rather than via signal.bode
+    V = _get_vander(0.01, 100, n_points, True, max(len(num), len(den)) - 1)
+    H = (V[:, :len(num)] @ num[::-1]) / (V[:, :len(den)] @ den[::-1])
+    # the dB and degree conversions run in place; arctan2 and unwrap still
+    # allocate their own outputs
+    mag = np.abs(H)
+    np.log10(mag, out=mag)
+    mag *= 20
+    phase = np.arctan2(H.imag, H.real)
+    phase = np.unwrap(phase)
+    np.rad2deg(phase, out=phase)
+
+    for arr in (num, den, mag, phase):
+        arr.flags.writeable = False
+    return num, den, freq_range, mag, phase
 
 
 class BodePlot:
     """ Main bode construct
-    param: numerator -> list of coefficients for numerator terms (descending power order) [optional]
-           denominator -> list of coefficients for denominator terms (descending power order) [optional]
+    param: numerator -> sequence of coefficients for numerator terms (descending power order) [optional]
+           denominator -> sequence of coefficients for denominator terms (descending power order) [optional]
            time_delay -> as in exp(-as), where a == time delay factor [optional]
+           n_points -> number of log-spaced frequency samples, default 1000 [optional]
            **kwargs -> dict of optional parameters supplied to pade function // TODO: extras for plot function
     """
 
-    def __init__(self, numerator=[1], denominator=[1], time_delay=None, **kwargs):
-        self.num = numerator
-        self.den = denominator
+    # figure skeleton shared by every plot() call, built on first use
+    _fig = None
+    _ax1 = None
+    _ax2 = None
+    _line1 = None
+    _line2 = None
+
+    def __init__(self, numerator=(1,), denominator=(1,), time_delay=None, **kwargs):
+        self.num = tuple(numerator)
+        self.den = tuple(denominator)
         self.td = time_delay
         self.sys = None
+        self._sys_key = None
+        self.n_points = 1000
         for k, v in kwargs.items():
             setattr(self, k, v)
+        if self.n_points != int(self.n_points) or self.n_points < 1:
+            raise ValueError("require n_points to be a positive integer")
+        self.n_points = int(self.n_points)
         self.bodefy()
 
-    @lru_cache(maxsize=2)
     def bodefy(self):
         """ Create Bode parameters from Transfer Function
 
         return: A tuple containing the frequency, magnitude, and phase of the given 
-                transfer function -> (w, mag, phase)
+                transfer function -> (w, mag, phase); w is the shared, read-only
+                frequency grid, mag and phase are private copies
         """
 
-        freq_range = np.linspace(0.01, 100, num=10 ** 6)
+        n = getattr(self, "n", 1)
         if self.td:
-            padefy = self.add_timedelay()
-            print(
-                f"Time delay uses Padé's Approximation of order: n = {getattr(self, 'n', 1)}"
-            )
-            self.sys = signal.TransferFunction(*padefy)
-        else:
-            self.sys = signal.TransferFunction(self.num, self.den)
+            print(f"Time delay uses Padé's Approximation of order: n = {n}")
+        key = (tuple(self.num), tuple(self.den), self.td, n)
+        num, den, w, mag, phase = _bodefy(*key, self.n_points)
+        # rebuild this instance's TransferFunction only when its parameters
+        # change; it is built from copies so it never aliases the cache
+        if key != self._sys_key:
+            self.sys = signal.TransferFunction(num.copy(), den.copy())
+            self._sys_key = key
         print('\n', self.sys)
-        return signal.bode(self.sys, freq_range)
+        return w, mag.copy(), phase.copy()
 
-    
-    @lru_cache(maxsize=2)
     def add_timedelay(self):
         """ Add a time delay function to a given transfer function
 
         return: tuple containing numerators and denominators of the combined transfer function
         """
 
-        pade_num, pade_den = pade(self.td, getattr(self, "n", 1))
-        ptf_num = np.poly1d(self.num)
-        ptf_den = np.poly1d(self.den)
-        ppade_num = np.poly1d(pade_num)
-        ppade_den = np.poly1d(pade_den)
-        num = ptf_num * ppade_num
-        den = ptf_den * ppade_den
-        return (num.c, den.c)
+        return _add_timedelay(self.num, self.den, self.td, getattr(self, "n", 1))
 
-    def plot(self, filename, show=True, savefig=True):
-        """ Plot Bode plots of given transfer function"""
+    @classmethod
+    def _build_figure(cls):
+        """ Create the figure, axes and (empty) lines reused across plots"""
 
-        w, mag, phase = self.bodefy()
         fig = plt.figure(figsize=(10, 10))
-        fig.suptitle(f"{filename} Bode Plots", fontsize=16)
         ax1 = fig.add_subplot(2, 1, 1)
         ax2 = fig.add_subplot(2, 1, 2)
 
         # subplot 1 -> Bode magnitude plot
-        ax1.semilogx(w, mag)
+        line1, = ax1.semilogx([], [])
         ax1.grid(which="major", axis="both", linewidth=2)
         ax1.grid(which="minor", axis="x", linewidth=0.5)
         ax1.set_xlim(0.01, 100)
@@ -80,7 +164,7 @@ class BodePlot:
         ax1.set_ylabel("Gain [dB]")
 
         # subplot 2 -> Bode phase plot
-        ax2.semilogx(w, phase)
+        line2, = ax2.semilogx([], [])
         ax2.grid(which="major", axis="both", linewidth=2)
         ax2.grid(which="minor", axis="x", linewidth=0.5)
         ax2.set_xlim(0.01, 100)
@@ -90,9 +174,35 @@ class BodePlot:
         ax2.set_xlabel("Frequency [rad/s]")
         ax2.set_ylabel("Phase [degrees]")
 
+        cls._fig, cls._ax1, cls._ax2 = fig, ax1, ax2
+        cls._line1, cls._line2 = line1, line2
+
+    def plot(self, filename, show=True, savefig=True):
+        """ Plot Bode plots of given transfer function
+
+        Every BodePlot draws into one shared figure, so each call replaces the
+        previous curves. To keep separate figures, close the current one
+        (plt.close()) or copy it before plotting the next transfer function.
+        """
+
+        w, mag, phase = self.bodefy()
+        # the grid is already log-spaced, so evenly strided indices keep the
+        # plotted points evenly spread on the log axis
+        if len(w) > 5000:
+            idx = np.linspace(0, len(w) - 1, 5000).astype(int)
+            w, mag, phase = w[idx], mag[idx], phase[idx]
+        # rebuild the skeleton if it was never made or its window was closed
+        if BodePlot._fig is None or not plt.fignum_exists(BodePlot._fig.number):
+            BodePlot._build_figure()
+        fig = BodePlot._fig
+        fig.suptitle(f"{filename} Bode Plots", fontsize=16)
+        BodePlot._line1.set_data(w, mag)
+        BodePlot._line2.set_data(w, phase)
+
         if savefig:
-            plt.savefig(f"{filename}.png", dpi=300)
+            fig.savefig(f"{filename}.png", dpi=300)
         if show:
+            fig.canvas.draw_idle()
             plt.show()
 
     def __repr__(self):
@@ -1,3 +1,50 @@
+from functools import lru_cache
+
+import numpy as np
+
+
+def _pade_coeffs_loop(T, n, numdeg):
+    """ Reference Padé coefficients via the accumulative loops of Alg 11.3.1"""
+
+    num = np.zeros(numdeg+1, dtype=np.float64)
+    num[-1] = 1.
+    cn = 1.
+    for k in range(1, numdeg+1):
+        # derived from Gloub and van Loan eq. for Dpq(z) on p. 572
+        # this accumulative style follows Alg 11.3.1
+        cn *= -T * (numdeg - k + 1)/(numdeg + n - k + 1)/k
+        num[numdeg-k] = cn
+
+    den = np.zeros(n+1, dtype=np.float64)
+    den[-1] = 1.
+    cd = 1.
+    for k in range(1, n+1):
+        # see cn above
+        cd *= T * (n - k + 1)/(numdeg + n - k + 1)/k
+        den[n-k] = cd
+    return num, den
+
+
+def _pade_coeffs_numpy(T, n, numdeg):
+    """ Padé coefficients with the running products of Alg 11.3.1 taken by np.cumprod"""
+
+    k = np.arange(1, numdeg+1, dtype=np.float64)
+    cn = np.cumprod(-T * (numdeg - k + 1)/(numdeg + n - k + 1)/k)
+    num = np.concatenate((cn[::-1], [1.]))
+
+    k = np.arange(1, n+1, dtype=np.float64)
+    cd = np.cumprod(T * (n - k + 1)/(numdeg + n - k + 1)/k)
+    den = np.concatenate((cd[::-1], [1.]))
+    return num, den
+
+
+# pade is lru_cached and orders large enough for a compiled loop to pay off
+# are numerically meaningless, so the NumPy path is the only one used;
+# _pade_coeffs_loop is kept as the reference it must match bit for bit
+_pade_coeffs = _pade_coeffs_numpy
+
+
+@lru_cache(maxsize=128)
 def pade(T, n=1, numdeg=None):
     """
     Create a linear system that approximates a delay.
@@ -19,6 +66,7 @@ def pade(T, n=1, numdeg=None):
     -------
     num, den : array
         Polynomial coefficients of the delay model, in descending powers of s.
+        float64 and read-only, as results are cached and shared between callers.
 
     Notes
     -----
@@ -40,27 +88,16 @@ def pade(T, n=1, numdeg=None):
         raise ValueError("require T >= 0")
     if not n >= 0:
         raise ValueError("require n >= 0")
+    if n != int(n) or numdeg != int(numdeg):
+        raise ValueError("require integer n and numdeg")
     if not (0 <= numdeg <= n):
         raise ValueError("require 0 <= numdeg <= n")
 
     if T == 0:
-        num = [1,]
-        den = [1,]
+        num = np.ones(1, dtype=np.float64)
+        den = np.ones(1, dtype=np.float64)
     else:
-        num = [0. for i in range(numdeg+1)]
-        num[-1] = 1.
-        cn = 1.
-        for k in range(1, numdeg+1):
-            # derived from Gloub and van Loan eq. for Dpq(z) on p. 572
-            # this accumulative style follows Alg 11.3.1
-            cn *= -T * (numdeg - k + 1)/(numdeg + n - k + 1)/k
-            num[numdeg-k] = cn
-
-        den = [0. for i in range(n+1)]
-        den[-1] = 1.
-        cd = 1.
-        for k in range(1, n+1):
-            # see cn above
-            cd *= T * (n - k + 1)/(numdeg + n - k + 1)/k
-            den[n-k] = cd
+        num, den = _pade_coeffs(float(T), int(n), int(numdeg))
+    num.flags.writeable = False
+    den.flags.writeable = False
     return num, den
@@ -0,0 +1,42 @@
+import numpy as np
+import pytest
+from scipy import signal
+
+from .bodeplot import _bodefy
+from .pade import _pade_coeffs_loop, _pade_coeffs_numpy, pade
+
+
+SYSTEMS = [
+    ((1.,), (1., 1.)),
+    ((1., 2.), (1., 3., 2.)),
+    ((2.,), (1., 0.5, 1.)),
+    ((1., 0.5, 4.), (1., 2., 3., 1.)),
+]
+
+
+@pytest.mark.parametrize("num, den", SYSTEMS)
+@pytest.mark.parametrize("td, n", [(None, 1), (0.5, 3), (1.0, 5)])
+def test_bodefy_matches_signal_bode(num, den, td, n):
+    ref_num, ref_den = num, den
+    if td:
+        pade_num, pade_den = pade(td, n)
+        ref_num = np.polymul(num, pade_num)
+        ref_den = np.polymul(den, pade_den)
+
+    _, _, w, mag, phase = _bodefy(num, den, td, n, 1000)
+    _, ref_mag, ref_phase = signal.bode(
+        signal.TransferFunction(ref_num, ref_den), w=w
+    )
+
+    np.testing.assert_allclose(mag, ref_mag, rtol=0, atol=1e-6)
+    np.testing.assert_allclose(phase, ref_phase, rtol=0, atol=1e-6)
+
+
+@pytest.mark.parametrize("T", [0.1, 1.0, 2.5])
+@pytest.mark.parametrize("n, numdeg", [(1, 1), (3, 3), (5, 2), (10, 10), (20, 7)])
+def test_pade_coeffs_numpy_matches_loop(T, n, numdeg):
+    num, den = _pade_coeffs_numpy(T, n, numdeg)
+    ref_num, ref_den = _pade_coeffs_loop(T, n, numdeg)
+
+    assert np.array_equal(num, ref_num)
+    assert np.array_equal(den, ref_den)